@@ -9,4 +9,13 @@ class TeleCFG:
     # Camera record setting
     width = 640
     height = 480
-    fps = 30
\ No newline at end of file
+    fps = 30
+
+    # Typical demo length; sizes the preallocated sample/frame buffers so a
+    # normal demo never triggers a mid-recording buffer grow (the buffers
+    # still double if a demo runs longer).
+    max_demo_seconds = 60
+
+    def capacity(self):
+        """Buffer row count for one demo: samples per demo plus slack."""
+        return int(self.max_demo_seconds / self.period) + 32
\ No newline at end of file
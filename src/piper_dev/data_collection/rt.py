@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Linux real-time helpers for the sampler threads.
+
+Wraps the libc calls the recorder needs for deterministic timing via
+``ctypes``. Everything degrades gracefully: on platforms (or containers)
+where libc or the call is unavailable, the helpers fall back to plain
+``time.sleep`` / no-ops so the recorder still runs, just with more jitter.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import time
+
+_CLOCK_MONOTONIC = getattr(time, "CLOCK_MONOTONIC", 1)
+_TIMER_ABSTIME = 1
+
+
+_SCHED_FIFO = 1
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+class _SchedParam(ctypes.Structure):
+    _fields_ = [("sched_priority", ctypes.c_int)]
+
+
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    _clock_nanosleep = _libc.clock_nanosleep
+    _clock_nanosleep.argtypes = [
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.POINTER(_Timespec),
+        ctypes.POINTER(_Timespec),
+    ]
+    _clock_nanosleep.restype = ctypes.c_int
+    # Full prototypes matter here: pthread_t is 64-bit on LP64 Linux, and
+    # without argtypes ctypes would truncate it to a C int and hand glibc a
+    # bogus thread handle (which segfaults, not errors).
+    _pthread_self = _libc.pthread_self
+    _pthread_self.argtypes = []
+    _pthread_self.restype = ctypes.c_ulong
+    _pthread_setschedparam = _libc.pthread_setschedparam
+    _pthread_setschedparam.argtypes = [
+        ctypes.c_ulong,
+        ctypes.c_int,
+        ctypes.POINTER(_SchedParam),
+    ]
+    _pthread_setschedparam.restype = ctypes.c_int
+except (OSError, AttributeError):
+    _libc = None
+    _clock_nanosleep = None
+    _pthread_self = None
+    _pthread_setschedparam = None
+
+
+def sleep_until(deadline_ns: int) -> None:
+    """Sleep until an absolute ``CLOCK_MONOTONIC`` deadline.
+
+    Uses ``clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME)`` so the kernel
+    wakes the thread at the absolute deadline: relative-sleep underrun and
+    accumulated scheduling drift do not build up between ticks. Returns
+    immediately if the deadline has already passed.
+
+    Args:
+      deadline_ns: Absolute deadline in nanoseconds on the same clock as
+        ``time.monotonic_ns()``.
+
+    Returns:
+      None
+    """
+    if _clock_nanosleep is not None:
+        ts = _Timespec(deadline_ns // 1_000_000_000, deadline_ns % 1_000_000_000)
+        # TIMER_ABSTIME keeps the deadline across EINTR, so just retry.
+        while _clock_nanosleep(_CLOCK_MONOTONIC, _TIMER_ABSTIME, ctypes.byref(ts), None) == errno.EINTR:
+            pass
+        return
+
+    # Fallback: relative sleep on the same clock.
+    remaining_ns = deadline_ns - time.monotonic_ns()
+    if remaining_ns > 0:
+        time.sleep(remaining_ns / 1e9)
+
+
+def set_realtime_priority(priority: int = 20) -> bool:
+    """Promote the calling thread to ``SCHED_FIFO`` at the given priority.
+
+    Real-time scheduling keeps terminal I/O and the garbage collector from
+    preempting the sampler between ticks. Requires ``CAP_SYS_NICE`` (or an
+    ``rtprio`` ulimit); without it the call fails and the thread simply stays
+    at the default ``SCHED_OTHER`` priority.
+
+    Args:
+      priority: SCHED_FIFO priority (1-99); a modest value is enough to
+        outrank every SCHED_OTHER task without starving kernel threads.
+
+    Returns:
+      True if the priority change took effect, False otherwise.
+    """
+    if _pthread_setschedparam is None:
+        return False
+    try:
+        param = _SchedParam(priority)
+        return _pthread_setschedparam(_pthread_self(), _SCHED_FIFO, ctypes.byref(param)) == 0
+    except OSError:
+        return False
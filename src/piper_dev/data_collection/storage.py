@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""Demo dataset (de)serialization helpers.
+
+A dataset is a dict with the ``instruction`` string and a ``demos`` list of
+per-demo dicts (state matrix + frame block). It is written as a directory of
+flat ``.npy`` files (``demo_0_state.npy`` / ``demo_0_rgb.npy`` / ...) plus a
+small JSON manifest for the scalar entries and the demo count. Writes go straight through NumPy's C
+serialization path, and loads open each array with ``mmap_mode='r'`` — the
+OS demand-pages pixels in as consumers iterate, so reading a multi-GB task
+never materializes the whole frame block in RAM.
+
+``load_demos`` reconstructs the nested ``demos`` dict and transparently reads
+the legacy single-file formats by sniffing the file magic: the flat ``.npz``
+archive, the zstd-compressed pickle-5 out-of-band layout, the uncompressed
+variant of the same layout, and plain ``pickle.dump`` files.
+
+Legacy layout (inside the optional zstd stream):
+  [8-byte LE header length][pickle-5 header]
+  [for each out-of-band buffer: 8-byte LE length][raw bytes]
+"""
+
+import json
+import os
+import pickle
+import struct
+
+import numpy as np
+import zstandard as zstd
+
+_LEN = struct.Struct("<Q")
+
+# File magics used to dispatch load_demos.
+_ZIP_MAGIC = b"PK\x03\x04"            # .npz archive (current format)
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"     # legacy zstd-compressed layout
+_PICKLE_PROTO_OPCODE = 0x80           # legacy plain pickle stream
+
+_STATE_SUFFIX = "_state"
+_RGB_SUFFIX = "_rgb"
+_MANIFEST = "manifest.json"
+
+
+def dump_demos(demos: dict, dirpath: str) -> None:
+    """Serialize a dataset dict as a directory of flat ``.npy`` files.
+
+    Each demo contributes two contiguous arrays (``demo_{i}_state.npy`` as
+    ``(T, 7)`` float64 and ``demo_{i}_rgb.npy`` as ``(T, H, W, 3)`` uint8);
+    scalar entries such as ``instruction`` go into the JSON manifest along
+    with the demo count. The coercion is a no-copy no-op when the recorder
+    already stored arrays.
+
+    Args:
+      demos: Dataset dict: ``instruction`` plus the ``demos`` list of
+        per-demo dicts (see ``teleoperation.main``).
+      dirpath: Destination directory of the dataset (created if missing).
+
+    Returns:
+      None
+    """
+    os.makedirs(dirpath, exist_ok=True)
+    manifest = {key: value for key, value in demos.items() if key != "demos"}
+    manifest["demos"] = len(demos["demos"])
+    for i, demo in enumerate(demos["demos"]):
+        np.save(os.path.join(dirpath, f"demo_{i}{_STATE_SUFFIX}"), np.asarray(demo["state"], dtype=np.float64))
+        np.save(os.path.join(dirpath, f"demo_{i}{_RGB_SUFFIX}"), np.asarray(demo["rgb"], dtype=np.uint8))
+    with open(os.path.join(dirpath, _MANIFEST), "w") as f:
+        json.dump(manifest, f)
+
+
+def load_demos(filepath: str) -> dict:
+    """Load a demos dict written by ``dump_demos``.
+
+    Arrays from the current directory layout are opened with
+    ``mmap_mode='r'``: consumers stream pages on demand instead of pulling
+    every frame into RAM up front. The legacy single-file formats (``.npz``
+    and the pickle-based layouts) are handled transparently.
+
+    Args:
+      filepath: Path of the dataset directory (or a legacy dataset file).
+
+    Returns:
+      The deserialized dataset dict (``instruction`` + ``demos`` list).
+    """
+    if os.path.isdir(filepath):
+        return _load_dir(filepath)
+    with open(filepath, "rb", buffering=1 << 20) as f:
+        magic = f.peek(4)[:4]
+        if magic == _ZIP_MAGIC:
+            return _to_schema(_load_npz(filepath))
+        if magic == _ZSTD_MAGIC:
+            # Legacy zstd-compressed out-of-band layout.
+            with zstd.ZstdDecompressor().stream_reader(f) as z:
+                return _to_schema(_read_stream(z))
+        if magic[:1] == bytes([_PICKLE_PROTO_OPCODE]):
+            # Legacy in-band pickle.
+            return _to_schema(pickle.load(f))
+        # Legacy uncompressed out-of-band layout.
+        return _to_schema(_read_stream(f))
+
+
+def _load_dir(dirpath: str) -> dict:
+    """Rebuild the dataset dict from the manifest + ``.npy`` layout."""
+    with open(os.path.join(dirpath, _MANIFEST)) as f:
+        manifest = json.load(f)
+    names = manifest.pop("demos")
+    if isinstance(names, int):
+        names = [f"demo_{i}" for i in range(names)]
+    demos = dict(manifest)
+    demos["demos"] = [
+        {
+            "state": np.load(os.path.join(dirpath, name + _STATE_SUFFIX + ".npy"), mmap_mode="r"),
+            "rgb": np.load(os.path.join(dirpath, name + _RGB_SUFFIX + ".npy"), mmap_mode="r"),
+        }
+        for name in names
+    ]
+    return demos
+
+
+def _to_schema(legacy: dict) -> dict:
+    """Convert a legacy ``demo_{i}``-keyed dict to the ``demos``-list schema."""
+    if "demos" in legacy:
+        return legacy
+    demos = {key: value for key, value in legacy.items() if not isinstance(value, dict)}
+    n = sum(isinstance(value, dict) for value in legacy.values())
+    demos["demos"] = [legacy[f"demo_{i}"] for i in range(n)]
+    return demos
+
+
+def _load_npz(filepath: str) -> dict:
+    """Rebuild the nested demos dict from the flat ``.npz`` key layout."""
+    demos = {}
+    with np.load(filepath, allow_pickle=False) as npz:
+        for key in npz.files:
+            if key.endswith(_STATE_SUFFIX):
+                demos.setdefault(key[: -len(_STATE_SUFFIX)], {})["state"] = npz[key]
+            elif key.endswith(_RGB_SUFFIX):
+                demos.setdefault(key[: -len(_RGB_SUFFIX)], {})["rgb"] = npz[key]
+            else:
+                value = npz[key][()]
+                demos[key] = str(value) if isinstance(value, np.str_) else value
+    return demos
+
+
+def _read_exact(f, n: int) -> bytes:
+    """Read exactly ``n`` bytes (stream readers may return short reads)."""
+    chunks = []
+    while n > 0:
+        chunk = f.read(n)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        n -= len(chunk)
+    return b"".join(chunks)
+
+
+def _read_stream(f) -> dict:
+    """Parse the legacy length-prefixed header + out-of-band buffer layout."""
+    (header_len,) = _LEN.unpack(_read_exact(f, _LEN.size))
+    header = _read_exact(f, header_len)
+    buffers = []
+    while True:
+        prefix = _read_exact(f, _LEN.size)
+        if not prefix:
+            break
+        (nbytes,) = _LEN.unpack(prefix)
+        buffers.append(_read_exact(f, nbytes))
+    return pickle.loads(header, buffers=buffers)
@@ -12,164 +12,287 @@ Hotkeys:
 
 Attributes:
   PERIOD (float): Sampling period in seconds.
-  DATA_SAVED_PATH (str): Directory where the dataset pickle is saved.
+  DATA_SAVED_PATH (str): Directory where the dataset archive is saved.
 """
 
-import copy
 import os
-import pickle
+import queue
+import select
+import sys
+import termios
 import threading
 import time
+import tty
 from termcolor import colored
-from typing import List
 
+import cv2
 import numpy as np
 from piper_sdk import *
 from pyorbbecsdk import *
-from piper_dev.utils import connect_camera, current_state, current_joint
-from piper_dev.utils import frame_to_bgr_image, bgrs_to_rgbs
+from piper_dev.utils import connect_camera, make_state_reader, current_joint
+from piper_dev.utils import frame_to_bgr_image
 
 from piper_dev.data_collection.config import TeleCFG
+from piper_dev.data_collection.rt import set_realtime_priority, sleep_until
+from piper_dev.data_collection.storage import dump_demos
 
 # ===== Settings =====
 config = TeleCFG()
 PERIOD = config.period          # Sampling period (seconds)
+PERIOD_NS = int(PERIOD * 1e9)   # Sampling period in integer nanoseconds
 DATA_SAVED_PATH = config.saved_path
 os.makedirs(DATA_SAVED_PATH, exist_ok=True)
 # Camera setting
 WIDTH = config.width
 HEIGHT = config.height
 FPS = config.fps
+# Buffer rows for one demo (grows by doubling if a demo runs longer).
+CAPACITY = config.capacity()
 
 
 def state_loop_tick_broadcast(
     piper: C_PiperInterface_V2,
     record_on: threading.Event,
     quit_on: threading.Event,
-    # events
-    tick_evt: threading.Event,     # Arm -> (Arm & Cam): broadcast "tick" to start this shot
-    cam_done: threading.Event,     # Cam -> Arm: ack when the camera frame for this shot is ready
+    # control
+    ctrl: threading.Condition,     # Guards record_on/session transitions
+    session: list,                 # One-element list: id bumped on every stop
+    # handshake
+    tick_sem: threading.Semaphore,  # Arm -> Cam: one token per shot ("tick")
+    done_sem: threading.Semaphore,  # Cam -> Arm: one token per captured frame
     # buffer
-    buf_lock: threading.Lock,
-    state: list,                   # Append: robot state samples for each shot
-    joint: list,
+    state_buf: list,               # One-element list holding the (cap, 7) sample buffer
+    state_n: list,                 # One-element list: number of rows written so far
 ) -> None:
     """Arm thread loop: fixed-rate driver with tick broadcast and camera ack.
 
     The arm thread maintains a drift-free fixed-rate schedule. At each shot, it
-    broadcasts a ``tick`` event to trigger both the arm sampling and the camera
-    capture nearly simultaneously, appends the arm sample to the buffer, and
-    then waits for the camera acknowledgment before advancing to the next tick.
+    releases one ``tick`` token to trigger the camera capture nearly
+    simultaneously with the arm sampling, writes the arm sample into the next
+    free row of the preallocated buffer, and then waits for the camera
+    acknowledgment token before advancing to the next tick. Unlike the earlier
+    Event pair, each semaphore hop is a single futex wait with no set/clear
+    race: a token is consumed exactly once.
+
+    The buffer is a single contiguous ``(capacity, 7)`` float64 array so each
+    tick only fills one row in place instead of allocating a fresh (7,) array;
+    when full, the capacity is doubled (amortized O(1) per sample).
+
+    Start/stop is coordinated through ``ctrl`` and the session id: the thread
+    sleeps on a predicate wait between sessions (no polling), captures the
+    session id when recording starts, and re-checks it after every deadline
+    sleep — a stop that lands mid-sleep therefore cannot emit one extra tick
+    into a dead session.
 
     Args:
       piper: Connected robot arm interface.
       record_on: Event toggling recording on/off.
       quit_on: Event signaling both threads to exit.
-      tick_evt: Event used to broadcast the start of a shot.
-      cam_done: Event set by the camera when its frame for the shot is ready.
-      buf_lock: Mutex protecting access to ``state``.
-      state: List buffer to append arm samples to (one per shot).
+      ctrl: Condition guarding recording state transitions.
+      session: One-element list holding the current session id; bumped by the
+        main thread on every stop so workers can discard stale work.
+      tick_sem: Semaphore released once per shot to start the camera capture.
+      done_sem: Semaphore released by the camera when its frame is ready.
+      state_buf: One-element list holding the ``(capacity, 7)`` float64 buffer
+        (rebound in place when the buffer is grown).
+      state_n: One-element list holding the count of rows written so far; the
+        store is a single GIL-atomic assignment, so no lock is needed for the
+        single-producer/single-consumer handoff.
 
     Returns:
       None
     """
-    next_tick = None
-    while not quit_on.is_set():
-        if not record_on.is_set():
-            next_tick = None
-            time.sleep(0.01)
-            continue
-
-        # Drift-free schedule: sleep until the next tick boundary.
-        now = time.perf_counter()
-        if next_tick is None:
-            # First shot starts on the next period boundary (adjust as needed).
-            next_tick = now + PERIOD
-        if now < next_tick:
-            time.sleep(next_tick - now)
-
-        # 1) Broadcast "tick": arm & camera start this shot near-simultaneously.
-        tick_evt.set()
-
-        # 2) Sample the arm.
-        sample = current_state(piper)
-        # print(f"time_1: {time.perf_counter():.2f}")
-        # joint_sample = current_joint(piper)
-
-        # 3) Append the arm sample.
-        with buf_lock:
-            state.append(sample)
-            # joint.append(joint_sample)
-
-        # 4) Wait for the camera to finish this shot (prevents the arm advancing early).
-        cam_done.wait()
-        cam_done.clear()
-
-        # 5) Schedule the next shot.
-        next_tick += PERIOD
+    # Best effort: SCHED_FIFO keeps terminal I/O and GC from preempting the
+    # fixed-rate driver; without CAP_SYS_NICE the thread stays at SCHED_OTHER.
+    if not set_realtime_priority():
+        print(colored("Sampler running without SCHED_FIFO (needs CAP_SYS_NICE).", "magenta"))
+
+    # Prebound reader: the SDK getters are resolved once, not per tick.
+    read_state = make_state_reader(piper)
+
+    # Hot-loop locals: resolve the per-tick callables once instead of paying a
+    # module/instance attribute lookup on every shot.
+    monotonic_ns = time.monotonic_ns
+    wait_deadline = sleep_until
+    quit_set = quit_on.is_set
+    record_set = record_on.is_set
+    emit_tick = tick_sem.release
+    wait_cam = done_sem.acquire
+    period_ns = PERIOD_NS
+
+    while not quit_set():
+        # Sleep (no polling) until a session starts or the program quits.
+        with ctrl:
+            ctrl.wait_for(lambda: record_set() or quit_set())
+            my_session = session[0]
+        if quit_set():
+            break
+
+        # Drift-free schedule: absolute CLOCK_MONOTONIC deadlines in integer
+        # nanoseconds, so the kernel wakes exactly at the tick boundary and no
+        # relative-sleep underrun accumulates across shots. First shot starts
+        # on the next period boundary (adjust as needed).
+        next_tick = monotonic_ns() + period_ns
+        while not quit_set():
+            wait_deadline(next_tick)
+
+            # Re-check the predicate after the sleep: a stop that landed while
+            # we slept must not emit a tick into a dead session.
+            if not record_set() or session[0] != my_session:
+                break
+
+            # 1) Release the "tick" token: arm & camera start this shot near-simultaneously.
+            emit_tick()
+
+            # 2) Sample the arm directly into the next free buffer row.
+            n = state_n[0]
+            buf = state_buf[0]
+            if n >= buf.shape[0]:
+                # Buffer full: double capacity, keeping samples contiguous.
+                buf = np.resize(buf, (buf.shape[0] * 2, 7))
+                state_buf[0] = buf
+            read_state(buf[n])
+            # print(f"time_1: {time.perf_counter():.2f}")
+
+            # 3) Publish the sample by bumping the row counter (GIL-atomic store).
+            state_n[0] = n + 1
+
+            # 4) Wait for the camera to finish this shot (prevents the arm advancing early).
+            wait_cam()
+
+            # 5) Schedule the next shot at an absolute deadline.
+            next_tick += period_ns
 
 
 def rgb_loop_tick_broadcast(
     pipeline,
     record_on: threading.Event,
     quit_on: threading.Event,
-    # events
-    tick_evt: threading.Event,     # Arm -> (Arm & Cam): broadcast "tick"
-    cam_done: threading.Event,     # Cam -> Arm: ack after a frame is captured
+    # control
+    ctrl: threading.Condition,     # Guards record_on/session transitions
+    session: list,                 # One-element list: id bumped on every stop
+    # handshake
+    tick_sem: threading.Semaphore,  # Arm -> Cam: one token per shot ("tick")
+    done_sem: threading.Semaphore,  # Cam -> Arm: ack after a frame is captured
     # buffer
-    buf_lock: threading.Lock,
-    rgb: list,                     # Append: BGR frames (numpy arrays) per shot
+    decode_q: queue.Queue,         # Raw color frame handles awaiting decode
 ) -> None:
-    """Camera thread loop: wait for tick, capture one frame, then ack.
+    """Camera thread loop: wait for tick, grab one raw frame, then ack.
+
+    The camera thread blocks on the ``tick`` semaphore, grabs exactly one raw
+    color frame per token (retrying by ``wait_for_frames`` until a valid frame
+    is returned), hands the undecoded frame handle to the decoder thread, and
+    immediately releases ``done_sem`` so the arm can advance while the image
+    decode runs off the tick path. Consuming a token is atomic, so a tick can
+    never be missed the way an ``Event.clear()`` race could drop one.
 
-    The camera thread blocks on the broadcast ``tick`` event, consumes it,
-    captures exactly one color frame (retrying by ``wait_for_frames`` until a
-    valid frame is returned), appends the frame to the buffer, and then sets
-    ``cam_done`` to let the arm proceed to the next shot.
+    Between sessions the thread sleeps on a predicate wait on ``ctrl``; after
+    consuming a tick token it re-checks the session id, so a token released
+    just to wake it at stop time never turns into a frame of the next session.
 
     Args:
       pipeline: Initialized camera/pipeline handle.
       record_on: Event toggling recording on/off.
       quit_on: Event signaling both threads to exit.
-      tick_evt: Event set by the arm to start a shot.
-      cam_done: Event set by the camera when the frame is ready.
-      buf_lock: Mutex protecting access to ``rgb``.
-      rgb: List buffer to append converted BGR frames to (one per shot).
+      ctrl: Condition guarding recording state transitions.
+      session: One-element list holding the current session id.
+      tick_sem: Semaphore released by the arm to start a shot.
+      done_sem: Semaphore released by the camera when the raw frame is grabbed.
+      decode_q: Bounded queue of raw frame handles; the bound provides
+        back-pressure if decoding ever falls behind the tick rate.
 
     Returns:
       None
     """
-    while not quit_on.is_set():
-        if not record_on.is_set():
-            time.sleep(0.01)
-            continue
-
-        # Wait for the "tick" and consume it to process this shot exactly once.
-        tick_evt.wait()
-        tick_evt.clear()
-
-        # Capture a single frame; strictly wait until a valid color frame is obtained.
-        color_frame = None
-        while not quit_on.is_set() and record_on.is_set():
-            frames = pipeline.wait_for_frames(100)
-            if frames is None:
-                continue
-            cf = frames.get_color_frame()
-            if cf is not None:
-                # print(f"time_2: {time.perf_counter():.2f}")
-                color_frame = frame_to_bgr_image(cf)
+    # Hot-loop locals: resolve the per-shot callables once.
+    quit_set = quit_on.is_set
+    record_set = record_on.is_set
+    take_tick = tick_sem.acquire
+    ack_done = done_sem.release
+    wait_for_frames = pipeline.wait_for_frames
+    enqueue = decode_q.put
+
+    while not quit_set():
+        # Sleep (no polling) until a session starts or the program quits.
+        with ctrl:
+            ctrl.wait_for(lambda: record_set() or quit_set())
+            my_session = session[0]
+        if quit_set():
+            break
+
+        while not quit_set():
+            # Consume one "tick" token to process this shot exactly once.
+            take_tick()
+
+            # A token released just to wake us at stop time is not a shot.
+            if not record_set() or session[0] != my_session:
                 break
 
-        if color_frame is None:
-            # Device stopped or transient failure: do not ack; arm will keep waiting or the user will stop.
-            continue
+            # Grab a single raw frame; strictly wait until a valid color frame is obtained.
+            cf = None
+            while not quit_set() and record_set():
+                frames = wait_for_frames(100)
+                if frames is None:
+                    continue
+                cf = frames.get_color_frame()
+                if cf is not None:
+                    # print(f"time_2: {time.perf_counter():.2f}")
+                    break
+
+            if cf is None:
+                # Device stopped or transient failure: do not ack; arm will keep waiting or the user will stop.
+                continue
+
+            # Hand off the undecoded frame and ack immediately: the decode happens
+            # in the decoder thread while the arm schedules the next shot.
+            enqueue(cf)
+            ack_done()
+
+
+def rgb_decode_loop(
+    decode_q: queue.Queue,         # Raw color frame handles from the camera thread
+    rgb_buf: list,                 # One-element list holding the (cap, H, W, 3) frame buffer
+    rgb_n: list,                   # One-element list: number of frames written so far
+) -> None:
+    """Decoder thread loop: convert raw frames into the frame buffer in place.
+
+    Pulls raw frame handles from ``decode_q``, runs the (comparatively slow)
+    format conversion, and writes the RGB result directly into the next free
+    row of the preallocated frame buffer — no per-frame output allocation and
+    no list-to-array promotion at save time. A ``None`` sentinel shuts the
+    loop down. ``task_done`` is called per item so the main thread can
+    ``decode_q.join()`` to wait for in-flight decodes before snapshotting the
+    buffer.
 
-        # Append the camera frame.
-        with buf_lock:
-            rgb.append(color_frame)
+    Args:
+      decode_q: Bounded queue of raw frame handles (``None`` terminates).
+      rgb_buf: One-element list holding the ``(capacity, H, W, 3)`` uint8
+        buffer (rebound in place when the buffer is grown).
+      rgb_n: One-element list holding the count of frames written so far; the
+        store is a single GIL-atomic assignment, so no lock is needed for the
+        single-producer/single-consumer handoff.
 
-        # Ack completion so the arm can advance to the next shot.
-        cam_done.set()
+    Returns:
+      None
+    """
+    while True:
+        cf = decode_q.get()
+        if cf is None:
+            decode_q.task_done()
+            break
+        image = frame_to_bgr_image(cf)
+        if image is not None:
+            n = rgb_n[0]
+            buf = rgb_buf[0]
+            if n >= buf.shape[0]:
+                # Buffer full: double capacity, keeping frames contiguous.
+                buf = np.resize(buf, (buf.shape[0] * 2,) + buf.shape[1:])
+                rgb_buf[0] = buf
+            # BGR -> RGB straight into the buffer row (RGB is safer for most
+            # consumers); cvtColor writes dst in place, no fresh allocation.
+            cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=buf[n])
+            rgb_n[0] = n + 1
+        decode_q.task_done()
 
 
 def main() -> None:
@@ -177,11 +300,11 @@ def main() -> None:
 
     Connects to the robot arm and camera, starts the worker threads, runs the
     keyboard-driven loop for recording/ending/rejecting trajectories, and saves
-    the dataset as a pickle at the end.
+    the dataset as a directory of .npy files at the end.
 
     Hotkeys:
-      - b: Start a new recording session into ``demo_{idx}``.
-      - n: Save the current session's buffers into ``demos``.
+      - b: Start a new recording session.
+      - n: Save the current session's buffers as the next demo.
       - m: Reject (clear) the current buffers without saving.
       - q: Quit the program.
 
@@ -197,65 +320,115 @@ def main() -> None:
     print(colored("Change Config in 'config.py'", "yellow"))
     print(colored("b=Start Record; n=Save Trajectory; m=Reject Trajectory; q=Quit System", "cyan"))
 
-    demos = {}
-    idx = 0
-
-    # joint: List = []
-    state: List = []
-    rgb: List = []
-    buf_lock = threading.Lock()
+    # Finished trajectories, in recording order; the list index is the demo id,
+    # so saving and the dataset builder never juggle stringified keys.
+    trajs = []
+
+    # Preallocated contiguous state buffer: the arm thread fills rows in place
+    # and bumps the counter, so no per-tick (7,) arrays are allocated.
+    state_buf = [np.empty((CAPACITY, 7), dtype=np.float64)]
+    state_n = [0]
+    # Preallocated contiguous frame buffer, mirroring the state buffer: the
+    # decoder converts straight into rows, so frames never live as a Python
+    # list and saving is a single slice copy.
+    rgb_buf = [np.empty((CAPACITY, HEIGHT, WIDTH, 3), dtype=np.uint8)]
+    rgb_n = [0]
+    # Capture -> decode handoff; the small bound gives back-pressure if the
+    # image decode ever falls behind the tick rate.
+    decode_q: queue.Queue = queue.Queue(maxsize=4)
 
     record_on = threading.Event()
     quit_on = threading.Event()
 
-    # Events: shared tick broadcast + camera completion ack.
-    tick_evt = threading.Event()
-    cam_done = threading.Event()
+    # Recording transitions go through a Condition plus a session id: workers
+    # predicate-wait between sessions and discard any wake-up belonging to a
+    # session that was already stopped.
+    ctrl = threading.Condition()
+    session = [0]
+
+    # Handshake: one tick token per shot (arm -> cam) + one ack token back.
+    tick_sem = threading.Semaphore(0)
+    done_sem = threading.Semaphore(0)
+
+    def drain(sem: threading.Semaphore) -> None:
+        """Consume any stale tokens left over from a stopped session."""
+        while sem.acquire(blocking=False):
+            pass
 
     th_state = threading.Thread(
         target=state_loop_tick_broadcast,
-        args=(piper, record_on, quit_on, tick_evt, cam_done, buf_lock, state, joint),
+        args=(piper, record_on, quit_on, ctrl, session, tick_sem, done_sem, state_buf, state_n),
         daemon=True,
     )
     th_rgb = threading.Thread(
         target=rgb_loop_tick_broadcast,
-        args=(orbbec, record_on, quit_on, tick_evt, cam_done, buf_lock, rgb),
+        args=(orbbec, record_on, quit_on, ctrl, session, tick_sem, done_sem, decode_q),
+        daemon=True,
+    )
+    th_decode = threading.Thread(
+        target=rgb_decode_loop,
+        args=(decode_q, rgb_buf, rgb_n),
         daemon=True,
     )
     th_state.start()
     th_rgb.start()
+    th_decode.start()
+
+    # Non-blocking hotkeys: cbreak mode delivers single keypresses and the
+    # select() poll keeps the control loop out of blocking terminal reads, so
+    # the main thread never sits inside readline while the samplers run.
+    interactive = sys.stdin.isatty()
+    if interactive:
+        stdin_fd = sys.stdin.fileno()
+        old_term = termios.tcgetattr(stdin_fd)
+        tty.setcbreak(stdin_fd)
+
+    def next_cmd() -> str:
+        """Block until one hotkey character is available and return it."""
+        if not interactive:
+            return input("> ").strip().lower()[:1]
+        while True:
+            ready, _, _ = select.select([sys.stdin], [], [], 0.1)
+            if ready:
+                ch = sys.stdin.read(1).lower()
+                if ch and not ch.isspace():
+                    return ch
 
     try:
         while True:
-            cmd = input("> ").strip().lower()
+            cmd = next_cmd()
             if cmd == "b":
-                demos[f"demo_{idx}"] = {}
-                with buf_lock:
-                    # joint.clear()
-                    state.clear()
-                    rgb.clear()
-
-                # Reset per-session events and start recording.
-                tick_evt.clear()
-                cam_done.clear()
-                record_on.set()
-                print(colored(f"Recording: demo_{idx}", "green"))
+                # Sampler is idle (record_on cleared), plain resets are safe.
+                state_n[0] = 0
+                rgb_n[0] = 0
+
+                # Reset per-session handshake tokens and start recording.
+                drain(tick_sem)
+                drain(done_sem)
+                with ctrl:
+                    record_on.set()
+                    ctrl.notify_all()
+                print(colored(f"Recording: demo_{len(trajs)}", "green"))
 
             elif cmd == "n":
                 # Stop recording and copy buffers for saving.
-                record_on.clear()
-                tick_evt.set()
-                cam_done.set()
-
-                with buf_lock:
-                    to_save_state = copy.deepcopy(state)
-                    # to_save_joint = copy.deepcopy(joint)
-                    # Convert BGR frames to RGB before saving (safer for most consumers).
-                    to_save_rgb = bgrs_to_rgbs(copy.deepcopy(rgb))
-                    
-                    # joint.clear()
-                    state.clear()
-                    rgb.clear()
+                with ctrl:
+                    record_on.clear()
+                    session[0] += 1
+                tick_sem.release()
+                done_sem.release()
+
+                # Wait for in-flight decodes so the frame buffer is complete.
+                decode_q.join()
+
+                # Both buffers are contiguous and already in their stored
+                # layouts (float64 states, RGB frames): saving is one slice
+                # copy each, with no list-to-array promotion or pixel pass.
+                to_save_state = state_buf[0][:state_n[0]].copy()
+                to_save_rgb = rgb_buf[0][:rgb_n[0]].copy()
+
+                state_n[0] = 0
+                rgb_n[0] = 0
 
                 # Safety trim (should already match, but keep the invariant).
                 Ls, Lr = len(to_save_state), len(to_save_rgb)
@@ -264,54 +437,63 @@ def main() -> None:
                     print(colored(f"Trim tails to align: state={Ls} rgb={Lr} -> {L}", "magenta"))
                     to_save_state = to_save_state[:L]
                     to_save_rgb = to_save_rgb[:L]
-                
-                # demos[f"demo_{idx}"]["joint"] = to_save_joint
-                demos[f"demo_{idx}"]["state"] = to_save_state
-                demos[f"demo_{idx}"]["rgb"] = to_save_rgb
-                print(colored(f"Saved: demo_{idx} ({len(to_save_state)} states, {len(to_save_rgb)} frames)", "yellow"))
-                idx += 1
+
+                trajs.append({"state": to_save_state, "rgb": to_save_rgb})
+                print(colored(f"Saved: demo_{len(trajs) - 1} ({len(to_save_state)} states, {len(to_save_rgb)} frames)", "yellow"))
 
             elif cmd == "m":
                 # Stop recording and discard current buffers.
-                record_on.clear()
-                tick_evt.set()
-                cam_done.set()
-                with buf_lock:
-                    # joint.clear()
-                    state.clear()
-                    rgb.clear()
+                with ctrl:
+                    record_on.clear()
+                    session[0] += 1
+                tick_sem.release()
+                done_sem.release()
+                # Drain in-flight decodes so none leak into the next session.
+                decode_q.join()
+                state_n[0] = 0
+                rgb_n[0] = 0
                 print(colored("Rejected current trajectory.", "magenta"))
 
             elif cmd == "q":
                 # Quit: stop recording and wake any waiting threads.
-                record_on.clear()
-                quit_on.set()
-                tick_evt.set()
-                cam_done.set()
+                with ctrl:
+                    record_on.clear()
+                    quit_on.set()
+                    session[0] += 1
+                    ctrl.notify_all()
+                tick_sem.release()
+                done_sem.release()
                 break
             else:
                 print("Use: b / n / m / q")
 
     except KeyboardInterrupt:
-        quit_on.set()
-        tick_evt.set()
-        cam_done.set()
+        with ctrl:
+            quit_on.set()
+            session[0] += 1
+            ctrl.notify_all()
+        tick_sem.release()
+        done_sem.release()
+    finally:
+        if interactive:
+            # Restore line-buffered echo before the final instruction prompt.
+            termios.tcsetattr(stdin_fd, termios.TCSADRAIN, old_term)
 
     th_rgb.join()
     th_state.join()
+    # Sentinel shuts the decoder down after any queued frames are decoded.
+    decode_q.put(None)
+    th_decode.join()
 
     piper.DisconnectPort()
     orbbec.stop()
 
-    print(colored(f"\nTotal demos saved: {len(demos)}", "blue"))
+    print(colored(f"\nTotal demos saved: {len(trajs)}", "blue"))
 
-    if demos:
-        name = input("\nEnter a language instruction for this demo set (file will be saved as .pkl): ").strip() or "demo"
-        demos["instruction"] = name
-        name = f"{name}.pkl"
+    if trajs:
+        name = input("\nEnter a language instruction for this demo set (saved as a directory of .npy files): ").strip() or "demo"
         filepath = os.path.join(DATA_SAVED_PATH, name)
-        with open(filepath, "wb") as f:
-            pickle.dump(demos, f, protocol=pickle.HIGHEST_PROTOCOL)
+        dump_demos({"instruction": name, "demos": trajs}, filepath)
         print(colored(f"Demos saved to: {name}", "cyan"))
 
 
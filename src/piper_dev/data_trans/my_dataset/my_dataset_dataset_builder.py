@@ -2,11 +2,30 @@
 
 import os
 import numpy as np
-import pickle
 import tensorflow_datasets as tfds
 import tensorflow as tf
 
-PATH = "/home/szliutong/Project/piper_dev/dataset"
+from piper_dev.data_collection.storage import load_demos
+
+# Dataset location: overridable via the environment instead of baked into the
+# module, so builds on other machines need no source edit.
+PATH = os.environ.get("PIPER_DATASET_DIR", "/home/szliutong/Project/piper_dev/dataset")
+
+
+@tf.function(input_signature=[tf.TensorSpec((None, None, None, 3), tf.uint8)])
+def _encode_jpegs(frames):
+    """Batched JPEG encode as a persistent graph (traced once per process).
+
+    Handing TFDS pre-encoded bytes skips its per-step PIL encode path, and
+    the single graph call per demo amortizes the Python/TF boundary over the
+    whole (T, H, W, 3) block.
+    """
+    return tf.map_fn(
+        lambda im: tf.io.encode_jpeg(im, quality=90),
+        frames,
+        fn_output_signature=tf.string,
+    )
+
 
 class Builder(tfds.core.GeneratorBasedBuilder):
     """DatasetBuilder for my_dataset dataset."""
@@ -16,6 +35,13 @@ class Builder(tfds.core.GeneratorBasedBuilder):
             '0.1.0': 'Initial release.',
     }
 
+    # ArrayRecord output (pass file_format='array_record' at construction)
+    # gives index-based random access and larger aligned chunks, but TFDS can
+    # only read it through as_data_source() — as_dataset()/tfds.load raise
+    # NotImplementedError on ArrayRecord files, and the RLDS viewer consumes
+    # this dataset via tfds.load. TFRecord therefore stays the default;
+    # switch the viewer to as_data_source() before opting in.
+
     def _info(self) -> tfds.core.DatasetInfo:
         """Returns the dataset metadata matching the provided element_spec."""
         features = tfds.features.FeaturesDict({
@@ -29,7 +55,9 @@ class Builder(tfds.core.GeneratorBasedBuilder):
                 "is_last": tfds.features.Tensor(shape=(), dtype=tf.bool),
                 "is_terminal": tfds.features.Tensor(shape=(), dtype=tf.bool),
                 "observation": tfds.features.FeaturesDict({
-                    "image": tfds.features.Image(shape=(480, 640, 3), dtype=tf.uint8),
+                    # JPEG instead of the PNG default: ~5-10x faster to encode
+                    # and much smaller for camera frames, at negligible loss.
+                    "image": tfds.features.Image(shape=(480, 640, 3), dtype=tf.uint8, encoding_format='jpeg'),
                     "natural_language_instruction": tfds.features.Text(),
                     "EEF_state": tfds.features.Tensor(shape=(6,), dtype=tf.float32),
                     "gripper_state": tfds.features.Tensor(shape=(1,), dtype=tf.float32)
@@ -49,75 +77,99 @@ class Builder(tfds.core.GeneratorBasedBuilder):
 
     def _split_generators(self, dl_manager: tfds.download.DownloadManager):
         """Returns SplitGenerators."""
-        paths = []
         dir = os.path.abspath(PATH)
-        for i in os.listdir(dir):
-            paths.append(os.path.join(dir, i))
+        # scandir hands back DirEntry objects with the file type already
+        # cached, and the filter keeps stray files out of the load path:
+        # datasets are .npy directories, legacy dumps are .npz/.pkl files.
+        # Sorting makes the task order (and example keys) deterministic.
+        with os.scandir(dir) as it:
+            paths = sorted(
+                e.path for e in it
+                if e.is_dir() or e.name.endswith((".npz", ".pkl"))
+            )
 
         return {
                 'train': self._generate_examples(paths),
         }
 
     def _generate_examples(self, paths):
-        key = 0
-        for task_pkl in paths:
-            with open(task_pkl, "rb") as f:
-                demos = pickle.load(f)
-            
-            instruction = demos.get("instruction", "")
-            
-            demo_num = len(demos.keys()) - 1
-            for id in range(0, demo_num):
-                demo_key = f"demo_{id}"
-                demo = demos[demo_key]
-                states = self._as_np(demo["state"], dtype=np.float32)   # (T, 7)
-                rgbs   = self._as_np(demo["rgb"], dtype=np.uint8)       # (T, H, W, 3)
-                
-                T = int(min(len(states), len(rgbs)))
-                if T == 0:
-                    raise RuntimeError(f"In task \"{task_pkl}\", demo_{id} has no data!")
-                states = states[:T]
-                rgbs = rgbs[:T]
-
-                # Add Content
-                example = {
-                    "steps": self.steps_iter(T-1, states, rgbs, instruction),
-                }
-                
-                yield key, example
-                key += 1
+        """Fans the per-task files out over a Beam pipeline (one worker per file)."""
+        beam = tfds.core.lazy_imports.apache_beam
+        return beam.Create(paths) | beam.FlatMap(self._process_one)
+
+    def _process_one(self, task_pkl):
+        """Yields (key, example) for every demo inside one task file."""
+        demos = load_demos(task_pkl)
+
+        instruction = demos.get("instruction", "")
+
+        # Keys must be deterministic and globally unique under parallelism,
+        # so derive them from the task file name instead of a shared counter.
+        task_name = os.path.splitext(os.path.basename(task_pkl))[0]
+
+        demo_list = demos["demos"]
+        for id, demo in enumerate(demo_list):
+            states = self._as_np(demo["state"], dtype=np.float32)   # (T, 7)
+            rgbs   = self._as_np(demo["rgb"], dtype=np.uint8)       # (T, H, W, 3)
+            # Release eagerly: with the reference dropped, this demo's mapped
+            # pages can be reclaimed while the later demos stream, keeping the
+            # resident set at O(one demo) instead of O(task).
+            demo_list[id] = None
+            demo = None
+
+            T = int(min(len(states), len(rgbs)))
+            if T == 0:
+                raise RuntimeError(f"In task \"{task_pkl}\", demo_{id} has no data!")
+            states = states[:T]
+            rgbs = rgbs[:T]
+
+            # Add Content
+            example = {
+                "steps": self.batched_steps(T - 1, states, rgbs, instruction),
+            }
+
+            yield f"{task_name}_demo_{id}", example
 
     def _as_np(self, a, dtype=None):
-        arr = np.array(a)
-        return arr.astype(dtype) if (dtype is not None and arr.dtype != dtype) else arr
+        # asarray + astype(copy=False) never copy when the input is already an
+        # ndarray of the right dtype — in particular the memory-mapped uint8
+        # frame blocks pass through untouched and keep streaming from disk.
+        arr = np.asarray(a)
+        return arr.astype(dtype, copy=False) if dtype is not None else arr
     
-    def steps_iter(self, T, states, rgbs, instruction):
-        
-        for t in range(T):
-            image = rgbs[t]
-            state = states[t]
-            
-            # Fill data
-            action_list = states[t + 1] - states[t]
-            action = {
-                "gripper": np.reshape(action_list[-1], (1,)).astype(np.float32),
-                "rotation_delta": action_list[3:6],
-                "world_vector": action_list[0:3]
-            }
-            observation = {
-                "image": image,
-                "natural_language_instruction": instruction,
-                "EEF_state": state[0:6],
-                "gripper_state": np.reshape(state[-1], (1,)).astype(np.float32),
-            }
-            
-            yield {
-                "action": action,
-                "is_first": (t == 0),
-                "is_last":  (t == T - 1),
-                "is_terminal": (t == T - 1), 
-                "observation": observation,
-                "reward": np.float32(0.0),       # if no reward, default 0
-            }
-            
-        
\ No newline at end of file
+    def batched_steps(self, T, states, rgbs, instruction):
+        """Builds the episode's steps as batched arrays, one per feature.
+
+        Encoding the whole episode column-wise lets TFDS slice each feature
+        from one contiguous array instead of re-encoding T per-step Python
+        dicts; the deltas and flags are computed with vectorized ops.
+        """
+        # Fill data (vectorized over the T steps)
+        actions = states[1:T + 1] - states[:T]          # (T, 7)
+        is_last = np.zeros(T, dtype=np.bool_)
+        is_first = np.zeros(T, dtype=np.bool_)
+        if T > 0:
+            is_first[0] = True
+            is_last[T - 1] = True
+        # Constant column: a broadcast view over one scalar instead of writing
+        # (and keeping) T zeros per episode.
+        reward = np.broadcast_to(np.float32(0.0), (T,))
+
+        return {
+            "action": {
+                "gripper": actions[:, 6:7],
+                "rotation_delta": actions[:, 3:6],
+                "world_vector": actions[:, 0:3],
+            },
+            "is_first": is_first,
+            "is_last": is_last,
+            "is_terminal": is_last,
+            "observation": {
+                # Pre-encoded JPEG bytes: the Image feature stores them as is.
+                "image": list(_encode_jpegs(rgbs[:T]).numpy()),
+                "natural_language_instruction": [instruction] * T,
+                "EEF_state": states[:T, 0:6],
+                "gripper_state": states[:T, 6:7],
+            },
+            "reward": reward,                           # if no reward, default 0
+        }
\ No newline at end of file
@@ -11,7 +11,16 @@ import tensorflow_datasets as tfds
 DATASET_NAME = "my_dataset:0.1.0"
 DATA_DIR = "/home/szliutong/tensorflow_datasets"
 
-dataset = tfds.load(name=DATASET_NAME, data_dir=DATA_DIR, split='train', shuffle_files=False)
+# Read shards with a parallel interleave instead of one file at a time; TFDS
+# already splits the train split into multiple shards, so this overlaps the
+# per-shard TFRecord I/O. Prefetch decouples reading from the consumer loop.
+read_config = tfds.ReadConfig(
+    interleave_cycle_length=16,
+    interleave_block_length=1,
+)
+dataset = tfds.load(name=DATASET_NAME, data_dir=DATA_DIR, split='train',
+                    shuffle_files=False, read_config=read_config)
+dataset = dataset.prefetch(tf.data.AUTOTUNE)
 print(dataset)
 
 